@@ -0,0 +1,108 @@
+"""启动耗时基准测试
+
+在仓库根目录运行:  python Tools/bench_startup.py [次数] [日线数据库路径]
+
+每次在新的解释器中分别测量两种启动方式:
+  eager startup   - 旧的启动方式，先导入并创建数据获取、数据存储和选股三个子系统，再显示主窗口
+  lazy  startup   - 当前的启动方式，子系统在首次使用时才创建
+  lazy  first_use - 首次点击 Screen Stocks 时才支付的耗时（导入 pandas 并创建数据存储和选股模块）
+  lazy  warm_up   - 后台预热的耗时，仅在指定了有数据的日线数据库时测量
+没有图形界面（未设置 DISPLAY）时不创建窗口，只测量窗口之前的导入和初始化耗时，
+两种方式创建窗口的耗时相同，差值不受影响。
+
+探针在临时目录中运行，使用临时配置、临时数据库和临时 HOME，不会改动仓库和用户目录
+（tushare 的 set_token 会把 token 写入 ~/tk.csv）。
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+import statistics
+import subprocess
+from configparser import ConfigParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r'''
+import json, sys, time
+mode, headless = sys.argv[1], sys.argv[2] == '1'
+t0 = time.perf_counter()
+from src.config_manager import ConfigManager
+from src.gui import StockSystemGUI
+config = ConfigManager()
+daily_db = config.get_database_config()['daily_db']
+if mode == 'eager':
+    from src.data_acquisition import DataAcquisition
+    from src.data_storage import DataStorage
+    from src.stock_screener import StockScreener
+    DataAcquisition(config.get_api_config()['tushare_token'])
+    DataStorage(daily_db)
+    StockScreener(daily_db)
+if not headless:
+    gui = StockSystemGUI(config)
+    gui.root.update()
+t1 = time.perf_counter()
+timings = {"startup": t1 - t0}
+if mode == 'lazy':
+    if headless:
+        # 与 StockSystemGUI.screener 首次访问时的工作相同
+        from src.data_storage import DataStorage
+        from src.stock_screener import StockScreener
+        DataStorage(daily_db)
+        screener = StockScreener(daily_db)
+    else:
+        screener = gui.screener
+    t2 = time.perf_counter()
+    timings["first_use"] = t2 - t1
+    if screener.warm_up():
+        timings["warm_up"] = time.perf_counter() - t2
+if not headless:
+    gui.root.destroy()
+print(json.dumps(timings))
+'''
+
+
+def make_sandbox(daily_db=None):
+    """Create a temp working dir with its own config, database and HOME."""
+    sandbox = tempfile.mkdtemp(prefix='bench_startup_')
+    parser = ConfigParser()
+    parser.read(os.path.join(ROOT, 'config', 'settings.ini'))
+    parser['Database']['daily_db'] = os.path.abspath(daily_db) if daily_db else os.path.join(sandbox, 'daily_data.db')
+    parser['Database']['financial_db'] = os.path.join(sandbox, 'financial_data.db')
+    os.makedirs(os.path.join(sandbox, 'config'))
+    with open(os.path.join(sandbox, 'config', 'settings.ini'), 'w') as f:
+        parser.write(f)
+    os.makedirs(os.path.join(sandbox, 'home'))
+    return sandbox
+
+
+def run_once(mode, headless, sandbox):
+    """Run the probe in a fresh interpreter and return its timings."""
+    env = dict(os.environ, HOME=os.path.join(sandbox, 'home'), PYTHONPATH=ROOT)
+    out = subprocess.run(
+        [sys.executable, '-c', PROBE, mode, '1' if headless else '0'],
+        cwd=sandbox, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    daily_db = sys.argv[2] if len(sys.argv) > 2 else None
+    headless = sys.platform.startswith('linux') and not os.environ.get('DISPLAY')
+    print(f"runs: {runs}{', headless (window creation not included)' if headless else ''}")
+    sandbox = make_sandbox(daily_db)
+    try:
+        for mode in ('eager', 'lazy'):
+            samples = [run_once(mode, headless, sandbox) for _ in range(runs)]
+            for key in ('startup', 'first_use', 'warm_up'):
+                values = [s[key] * 1000 for s in samples if key in s]
+                if values:
+                    print(f"{mode:>5} {key:>9}: median {statistics.median(values):8.1f} ms  min {min(values):8.1f} ms")
+    finally:
+        shutil.rmtree(sandbox, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -36,4 +36,11 @@ class ConfigManager:
 
     def get_database_config(self):
         """Return database configuration."""
-        return self.config['Database']
\ No newline at end of file
+        return self.config['Database']
+
+    def get_screening_config(self):
+        """Return screening configuration, the section is optional."""
+        section = self.config.get('Screening', {})
+        return {
+            'warmup': section.get('warmup', 'false').strip().lower() in ('1', 'true', 'yes', 'on')
+        }
\ No newline at end of file
@@ -1,17 +1,51 @@
 import os
-import pandas as pd
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from src.data_acquisition import DataAcquisition
-from src.data_storage import DataStorage
-from src.stock_screener import StockScreener
 
 class StockSystemGUI:
     def __init__(self, config):
-        self.data_acquisition = DataAcquisition(config.get_api_config()['tushare_token'])
-        self.data_storage = DataStorage(config.get_database_config()['daily_db'])
-        self.screener = StockScreener(config.get_database_config()['daily_db'])
+        # 子系统在首次使用时才导入和创建（pandas/tushare 导入较慢），窗口可以先显示
+        self.config = config
+        self._data_acquisition = None
+        self._data_storage = None
+        self._screener = None
+        self._storage_lock = threading.Lock()
+        self._screener_lock = threading.Lock()
         self._create_gui()
+        if config.get_screening_config()['warmup']:
+            self.root.after(500, self._start_warm_up)
+
+    @property
+    def data_acquisition(self):
+        if self._data_acquisition is None:
+            from src.data_acquisition import DataAcquisition
+            self._data_acquisition = DataAcquisition(self.config.get_api_config()['tushare_token'])
+        return self._data_acquisition
+
+    @property
+    def data_storage(self):
+        # 预热线程和界面线程都可能访问，加锁保证只创建一次
+        with self._storage_lock:
+            if self._data_storage is None:
+                from src.data_storage import DataStorage
+                self._data_storage = DataStorage(self.config.get_database_config()['daily_db'])
+            return self._data_storage
+
+    @property
+    def screener(self):
+        with self._screener_lock:
+            if self._screener is None:
+                # DataStorage 负责建表，选股前必须先创建
+                self.data_storage
+                from src.stock_screener import StockScreener
+                self._screener = StockScreener(self.config.get_database_config()['daily_db'])
+            return self._screener
+
+    def _start_warm_up(self):
+        """Precompute screening results of all stocks in a background thread."""
+        # 选股模块的导入也放到后台线程，避免阻塞界面
+        threading.Thread(target=lambda: self.screener.start_warm_up(), daemon=True).start()
 
     def _create_gui(self):
         """Create the GUI interface."""
@@ -53,11 +87,18 @@ class StockSystemGUI:
             result = self.screener.run_screening(progress_callback=update_progress)
             
             progress_window.destroy()
-            if result:
-                messagebox.showinfo(
-                    "Success",
-                    f"Screening completed! {result['count']} stocks passed.\nResults saved to: {result['path']}"
+            if result and result['path'] is None:
+                messagebox.showwarning(
+                    "Warning",
+                    f"No valid codes in watchlist: {len(result['invalid'])} invalid, "
+                    f"{len(result['unknown'])} unlisted or delisted, see data/logs/"
                 )
+            elif result:
+                message = f"Screening completed! {result['count']} stocks passed.\nResults saved to: {result['path']}"
+                skipped = len(result['invalid']) + len(result['unknown'])
+                if skipped:
+                    message += f"\n{skipped} codes skipped (invalid, unlisted or delisted), see data/logs/"
+                messagebox.showinfo("Success", message)
             else:
                 messagebox.showinfo("Info", "No stocks processed or no results generated.")
         except Exception as e:
@@ -69,6 +110,7 @@ class StockSystemGUI:
         try:
             from datetime import datetime, timedelta
             import time
+            import pandas as pd
 
             latest_date = self.data_storage.get_latest_trade_date()
             start_date = (datetime.today() - timedelta(days=400)).strftime('%Y%m%d') if not latest_date else latest_date
@@ -101,6 +143,8 @@ class StockSystemGUI:
                 time.sleep(1 if idx % 5 != 0 else 2)
 
             messagebox.showinfo("Success", "Daily data updated successfully!")
+            if self.config.get_screening_config()['warmup']:
+                self._start_warm_up()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update daily data: {str(e)}")
 
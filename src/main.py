@@ -1,7 +1,20 @@
+import os
+import logging
 from src.config_manager import ConfigManager
 from src.gui import StockSystemGUI
 
+def setup_logging():
+    """Configure logging once, before any subsystem is created."""
+    log_dir = 'data/logs'
+    os.makedirs(log_dir, exist_ok=True)
+    logging.basicConfig(
+        filename=os.path.join(log_dir, 'data_update.log'),
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
 def main():
+    setup_logging()
     config = ConfigManager()
     gui = StockSystemGUI(config)
     gui.run()
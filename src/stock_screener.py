@@ -5,8 +5,11 @@ import numpy as np
 from datetime import datetime
 from tkinter import filedialog
 import logging
+import threading
+import multiprocessing
 from concurrent.futures import ProcessPoolExecutor
 from src.technical_analyzer import TechnicalAnalyzer
+from src.watchlist_loader import WatchlistLoader
 
 def process_stock(ts_code, df, analyzer):
     """Process a single stock for parallel execution."""
@@ -64,9 +67,15 @@ def process_stock(ts_code, df, analyzer):
         }
 
 class StockScreener:
-    def __init__(self, daily_db_path):
+    def __init__(self, daily_db_path, warmup_batch=500):
         self.daily_db = daily_db_path
         self.analyzer = TechnicalAnalyzer()
+        self.watchlist_loader = WatchlistLoader()
+        self.warmup_batch = warmup_batch
+        self._warm_cache = None
+        self._warm_thread = None
+        self._warm_pending = False
+        self._warm_lock = threading.Lock()
         self._setup_logging()
 
     def _setup_logging(self):
@@ -80,40 +89,124 @@ class StockScreener:
             delay=True
         )
 
+    def start_warm_up(self):
+        """Run warm_up in a background thread, at most one at a time.
+
+        A request made while a warm-up is running is queued and runs once the
+        current one finishes, so the cache reflects the latest database.
+        """
+        with self._warm_lock:
+            if self._warm_thread is not None and self._warm_thread.is_alive():
+                self._warm_pending = True
+                return
+            self._warm_thread = threading.Thread(target=self._warm_up_loop, daemon=True)
+            self._warm_thread.start()
+
+    def _warm_up_loop(self):
+        while True:
+            self.warm_up()
+            with self._warm_lock:
+                if not self._warm_pending:
+                    return
+                self._warm_pending = False
+
+    def warm_up(self):
+        """Precompute the screening result of every stock in the database.
+
+        Each stock's full history is read in batches and evaluated with
+        process_stock in a background process pool, exactly as run_screening
+        would, so cached results are identical to a cold screen. Only the
+        per-stock result dicts are kept in memory; they are published batch
+        by batch and reused by run_screening until the database file changes.
+        Returns the number of cached stocks.
+        """
+        try:
+            results = {}
+            self._warm_cache = {'mtime': os.path.getmtime(self.daily_db), 'results': results}
+            conn = sqlite3.connect(self.daily_db)
+            try:
+                ts_codes = [row[0] for row in conn.execute("SELECT DISTINCT ts_code FROM daily_data ORDER BY ts_code")]
+
+                # spawn instead of fork: this runs in a background thread next to the Tk mainloop
+                with ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2),
+                                         mp_context=multiprocessing.get_context('spawn')) as executor:
+                    for start in range(0, len(ts_codes), self.warmup_batch):
+                        batch = ts_codes[start:start + self.warmup_batch]
+                        placeholders = ','.join('?' * len(batch))
+                        df_batch = pd.read_sql(
+                            f"SELECT * FROM daily_data WHERE ts_code IN ({placeholders}) ORDER BY ts_code, trade_date",
+                            conn, params=batch
+                        )
+                        futures = [executor.submit(process_stock, ts_code, df, self.analyzer)
+                                   for ts_code, df in df_batch.groupby('ts_code')]
+                        for future in futures:
+                            result = future.result()
+                            results[result['ts_code']] = result
+            finally:
+                conn.close()
+            return len(results)
+        except Exception as e:
+            logging.error(f"Warm-up failed: {str(e)}")
+            return 0
+
+    def _cached_results(self):
+        """Return warm-up results if they still match the database, else None."""
+        cache = self._warm_cache
+        try:
+            if cache is not None and cache['mtime'] == os.path.getmtime(self.daily_db):
+                return cache['results']
+        except OSError:
+            pass
+        return None
+
     def run_screening(self, progress_callback=None):
         """Run stock screening process and record results for all stocks."""
         try:
             # Select watchlist file
             csv_path = filedialog.askopenfilename(
                 title="Select Watchlist CSV",
-                filetypes=[("CSV files", "*.csv")]
+                filetypes=[("Watchlist files", "*.csv *.txt"), ("CSV files", "*.csv"), ("TXT files", "*.txt")]
             )
             if not csv_path:
                 return None
             
-            # Read stock codes
-            watchlist = pd.read_csv(csv_path)
-            ts_codes = watchlist['ts_code'].dropna().unique()
+            # Read, normalize and validate stock codes
+            watchlist = self.watchlist_loader.load(csv_path)
+            ts_codes = watchlist['codes']
             total = len(ts_codes)
+            if total == 0:
+                return {'count': 0, 'path': None, 'invalid': watchlist['invalid'], 'unknown': watchlist['unknown']}
             
-            # Batch query all stocks
-            conn = sqlite3.connect(self.daily_db)
-            ts_codes_str = ','.join(f"'{code}'" for code in ts_codes)
-            df_all = pd.read_sql(
-                f"SELECT * FROM daily_data WHERE ts_code IN ({ts_codes_str}) ORDER BY ts_code, trade_date",
-                conn
-            )
-            conn.close()
-            
-            # Parallel processing
-            results = []
-            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
-                futures = [executor.submit(process_stock, ts_code, df, self.analyzer)
-                           for ts_code, df in df_all.groupby('ts_code')]
-                for idx, future in enumerate(futures, 1):
-                    results.append(future.result())
-                    if progress_callback:
-                        progress_callback(idx / total * 100)
+            # Reuse warm-up results if any, never wait for an in-flight warm-up:
+            # stocks it has not reached yet are screened from the database
+            cached = self._cached_results()
+            if cached is not None:
+                results = [cached[code] for code in ts_codes if code in cached]
+                cold_codes = [code for code in ts_codes if code not in cached]
+            else:
+                results = []
+                cold_codes = list(ts_codes)
+            if progress_callback and results:
+                progress_callback(len(results) / total * 100)
+
+            if cold_codes:
+                # Batch query all stocks
+                conn = sqlite3.connect(self.daily_db)
+                ts_codes_str = ','.join(f"'{code}'" for code in cold_codes)
+                df_all = pd.read_sql(
+                    f"SELECT * FROM daily_data WHERE ts_code IN ({ts_codes_str}) ORDER BY ts_code, trade_date",
+                    conn
+                )
+                conn.close()
+
+                # Parallel processing
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    futures = [executor.submit(process_stock, ts_code, df, self.analyzer)
+                               for ts_code, df in df_all.groupby('ts_code')]
+                    for future in futures:
+                        results.append(future.result())
+                        if progress_callback:
+                            progress_callback(len(results) / total * 100)
             
             # Include stocks not found in database
             processed_codes = set(result['ts_code'] for result in results)
@@ -159,7 +252,12 @@ class StockScreener:
                 except Exception as e:
                     logging.error(f"基础信息合并失败: {str(e)}")
                     result_df.to_csv(save_path, index=False, encoding='utf-8-sig', float_format='%.2f')
-                return {'count': len(result_df[result_df['passed']]), 'path': save_path}
+                return {
+                    'count': len(result_df[result_df['passed']]),
+                    'path': save_path,
+                    'invalid': watchlist['invalid'],
+                    'unknown': watchlist['unknown']
+                }
             return None
         except Exception as e:
             logging.error(f"Screening process failed: {str(e)}")
@@ -0,0 +1,143 @@
+import os
+import logging
+import numpy as np
+import pandas as pd
+
+# 可识别的代码写法: 600000 / 600000.SH / SH600000 / sh.600000 / 600000SH
+CODE_PATTERN = r'^(?:(?P<prefix>SH|SZ|BJ)\.?)?(?P<digits>\d{1,6})(?:\.?(?P<suffix>SH|SZ|BJ))?$'
+
+
+def normalize_codes(codes):
+    """Normalize raw stock codes to ts_code format (e.g. 002292.SZ).
+
+    Uses vectorized string operations only. Codes that cannot be parsed, or
+    whose exchange prefix and suffix disagree, are returned as NaN.
+    """
+    s = pd.Series(codes, dtype=object).astype(str).str.strip().str.upper()
+    parts = s.str.extract(CODE_PATTERN).astype(object)
+    prefix, suffix = parts['prefix'], parts['suffix']
+
+    # 不足6位只可能是 Excel 去掉了深市代码的前导零，补零后必须是深市代码
+    padded = (parts['digits'].str.len() < 6).fillna(False).astype(bool)
+    digits = parts['digits'].str.zfill(6)
+    first = digits.str[:1]
+
+    # 未写交易所时按代码首位推断，与 Tools/ts_change.py 的规则一致，并补充北交所 4/92 开头
+    inferred = pd.Series(
+        np.select(
+            [
+                (first == '6').fillna(False).astype(bool),
+                first.isin(['0', '3']),
+                first.isin(['4', '8']) | (digits.str[:2] == '92').fillna(False).astype(bool),
+            ],
+            ['SH', 'SZ', 'BJ'],
+            default='',
+        ),
+        index=s.index,
+        dtype=object,
+    ).replace('', np.nan)
+    exchange = suffix.fillna(prefix).fillna(inferred)
+
+    conflict = (prefix.notna() & suffix.notna() & (prefix != suffix)) | (padded & (exchange != 'SZ'))
+    if conflict.any():
+        logging.warning(f"自选股代码交易所前后缀冲突，已忽略: {s[conflict].tolist()[:20]}")
+    valid = digits.notna() & exchange.notna() & ~conflict
+    if (padded & valid).any():
+        logging.warning(f"自选股代码不足6位，已补齐前导零: {s[padded & valid].tolist()[:20]}")
+
+    return (digits + '.' + exchange).where(valid)
+
+
+class WatchlistLoader:
+    def __init__(self, basic_path=os.path.join('data', 'stock_basic_all.csv'), chunksize=5000):
+        self.basic_path = basic_path
+        self.chunksize = chunksize
+        self._index = None
+        self._index_mtime = None
+
+    def _load_index(self):
+        """Build a hashed index of listed ts_codes from stock_basic_all.csv.
+
+        Returns None if the basic info file is unavailable, in which case
+        codes are not validated against it.
+        """
+        try:
+            mtime = os.path.getmtime(self.basic_path)
+        except OSError:
+            logging.error(f"基础信息文件不存在: {self.basic_path}")
+            return None
+        if self._index is None or mtime != self._index_mtime:
+            try:
+                basic = pd.read_csv(self.basic_path, usecols=['ts_code'], dtype=str, encoding='utf-8-sig')
+                self._index = pd.Index(basic['ts_code'].dropna().str.strip().str.upper().unique())
+                self._index_mtime = mtime
+            except Exception as e:
+                logging.error(f"基础信息索引构建失败: {str(e)}")
+                return None
+        return self._index
+
+    @staticmethod
+    def _detect_encoding(file_path):
+        """Return utf-8-sig if the file decodes as UTF-8, else gbk (common for broker exports)."""
+        with open(file_path, 'rb') as f:
+            try:
+                f.read().decode('utf-8-sig')
+                return 'utf-8-sig'
+            except UnicodeDecodeError:
+                return 'gbk'
+
+    def _read_chunks(self, file_path):
+        """Yield raw code chunks from a CSV (ts_code column) or TXT (code in the first field) file."""
+        encoding = self._detect_encoding(file_path)
+        if os.path.splitext(file_path)[1].lower() == '.txt':
+            # 通达信等软件导出的自选股为 tab 分隔的 代码、名称，其余字段忽略
+            reader = pd.read_csv(
+                file_path, sep=r'[\s,]+', engine='python', header=None, names=['ts_code'], usecols=[0],
+                dtype=str, encoding=encoding, skip_blank_lines=True, chunksize=self.chunksize
+            )
+        else:
+            columns = pd.read_csv(file_path, nrows=0, encoding=encoding).columns
+            if 'ts_code' not in columns:
+                raise ValueError(f"CSV文件中缺少ts_code字段: {file_path}")
+            reader = pd.read_csv(
+                file_path, usecols=['ts_code'], dtype=str,
+                encoding=encoding, chunksize=self.chunksize
+            )
+        for chunk in reader:
+            yield chunk['ts_code'].dropna()
+
+    def load(self, file_path):
+        """Load a watchlist file, normalize codes and check them against listed stocks.
+
+        Returns a dict with:
+            codes   - unique normalized codes found in stock_basic_all.csv
+            invalid - raw entries that could not be parsed as stock codes
+            unknown - normalized codes not in stock_basic_all.csv (unknown or delisted)
+        """
+        normalized, invalid = [], []
+        for raw in self._read_chunks(file_path):
+            codes = normalize_codes(raw)
+            bad = codes.isna()
+            if bad.any():
+                invalid.extend(raw[bad].tolist())
+            normalized.append(codes[~bad])
+
+        codes = pd.concat(normalized, ignore_index=True).drop_duplicates() if normalized else pd.Series([], dtype=object)
+
+        index = self._load_index()
+        if index is None:
+            known, unknown = codes, codes.iloc[:0]
+        else:
+            listed = codes.isin(index)
+            known, unknown = codes[listed], codes[~listed]
+
+        if invalid:
+            logging.error(f"自选股文件中有{len(invalid)}个无法识别的代码: {invalid[:20]}")
+        if len(unknown):
+            logging.error(f"自选股文件中有{len(unknown)}个未上市或已退市的代码: {unknown.tolist()[:20]}")
+
+        return {
+            'codes': known.to_numpy(),
+            'invalid': invalid,
+            'unknown': unknown.tolist(),
+        }
@@ -0,0 +1,62 @@
+import sqlite3
+import numpy as np
+import pandas as pd
+from src.data_storage import DataStorage
+from src.stock_screener import StockScreener, process_stock
+
+
+def _make_rows(ts_code, dates, seed):
+    rng = np.random.default_rng(seed)
+    close = 10 * np.cumprod(1 + rng.normal(0.002, 0.02, len(dates)))
+    return pd.DataFrame({
+        'ts_code': ts_code,
+        'trade_date': dates,
+        'open': close,
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'vol': rng.uniform(1e4, 2e4, len(dates)),
+        'pe_ttm': 10.0,
+        'pb': 1.0,
+        'total_mv': 1e6,
+    })
+
+
+def _make_flat_ma_rows(ts_code, dates):
+    # Period-240 prices: MA240 is mathematically flat, so the MA240-rising
+    # check sits exactly on a tie and only floating-point noise decides it.
+    k = np.arange(len(dates))
+    close = 10 + np.sin(2 * np.pi * k / 240) + 0.3 * np.sin(2 * np.pi * k / 8)
+    df = _make_rows(ts_code, dates, 0)
+    df['open'] = df['close'] = close
+    df['high'], df['low'] = close * 1.01, close * 0.99
+    return df
+
+
+def test_warm_up_matches_full_history(tmp_path):
+    db_path = str(tmp_path / 'daily_data.db')
+    DataStorage(db_path)
+    dates = pd.bdate_range('2020-01-01', periods=900).strftime('%Y%m%d').tolist()
+    frames = [
+        # 350 old rows, a long suspension, then 230 recent rows
+        _make_rows('000001.SZ', dates[:350] + dates[-230:], 1),
+        _make_rows('600000.SH', dates, 2),
+        _make_rows('300001.SZ', dates[-300:], 3),
+        _make_rows('000002.SZ', dates[-100:], 4),
+        _make_flat_ma_rows('600004.SH', dates),
+        _make_flat_ma_rows('600006.SH', dates[-613:]),
+    ]
+    with sqlite3.connect(db_path) as conn:
+        pd.concat(frames).to_sql('daily_data', conn, if_exists='append', index=False)
+
+    screener = StockScreener(db_path, warmup_batch=2)
+    screener.warm_up()
+    cached = screener._cached_results()
+
+    assert cached is not None
+    with sqlite3.connect(db_path) as conn:
+        df_all = pd.read_sql("SELECT * FROM daily_data ORDER BY ts_code, trade_date", conn)
+    assert set(cached) == set(df_all['ts_code'])
+    for ts_code, df in df_all.groupby('ts_code'):
+        expected = process_stock(ts_code, df, screener.analyzer)
+        assert pd.Series(cached[ts_code]).equals(pd.Series(expected)), ts_code
@@ -0,0 +1,47 @@
+import pandas as pd
+from src.watchlist_loader import normalize_codes, WatchlistLoader
+
+
+def test_normalize_codes_formats():
+    raw = ['600000', '600000.SH', 'sh600000', 'SH.600000', '600000sh', '000733.SZ',
+           ' 300729 ', '830799', '920001']
+    assert normalize_codes(raw).tolist() == [
+        '600000.SH', '600000.SH', '600000.SH', '600000.SH', '600000.SH', '000733.SZ',
+        '300729.SZ', '830799.BJ', '920001.BJ'
+    ]
+
+
+def test_normalize_codes_pads_excel_stripped_sz_codes_only():
+    result = normalize_codes(['2292', '1', '2292.SZ', '1.SH', '2292.BJ'])
+    assert result.tolist()[:3] == ['002292.SZ', '000001.SZ', '002292.SZ']
+    assert result.iloc[3:].isna().all()
+
+
+def test_normalize_codes_rejects_invalid_and_conflicting():
+    result = normalize_codes(['SH600000.SZ', 'abc', '9000001', '900001', ''])
+    assert result.isna().all()
+
+
+def test_loader_reports_invalid_and_unknown(tmp_path):
+    basic = tmp_path / 'stock_basic_all.csv'
+    pd.DataFrame({'ts_code': ['002292.SZ', '600000.SH'], 'name': ['a', 'b']}).to_csv(basic, index=False)
+    watchlist = tmp_path / 'watchlist.txt'
+    watchlist.write_text('2292\n600000\n600000.SH\n000004\nabc\n')
+
+    result = WatchlistLoader(basic_path=str(basic), chunksize=2).load(str(watchlist))
+
+    assert result['codes'].tolist() == ['002292.SZ', '600000.SH']
+    assert result['unknown'] == ['000004.SZ']
+    assert result['invalid'] == ['abc']
+
+
+def test_loader_reads_gbk_tab_separated_txt(tmp_path):
+    basic = tmp_path / 'stock_basic_all.csv'
+    pd.DataFrame({'ts_code': ['600000.SH', '000001.SZ', '300729.SZ']}).to_csv(basic, index=False)
+    watchlist = tmp_path / 'export.txt'
+    watchlist.write_bytes('600000\t浦发银行\n000001\t平安银行\t12.30\n\n300729,乐歌股份\n'.encode('gbk'))
+
+    result = WatchlistLoader(basic_path=str(basic)).load(str(watchlist))
+
+    assert result['codes'].tolist() == ['600000.SH', '000001.SZ', '300729.SZ']
+    assert result['invalid'] == []